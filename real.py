@@ -1,8 +1,23 @@
+import functools
 import math
 
-# TODO remove and replace with Real
+try:
+    from gmpy2 import mpz, bit_scan1
+    HAS_GMPY2 = True
+except ImportError:
+    mpz = int
+    bit_scan1 = None
+    HAS_GMPY2 = False
+
+# Only accurate enough for rough digit-count estimates; conversions that need
+# more use the Real-valued log10_2 below
 LOG_10_2 = math.log10(2)
 
+# Coefficients of Reals with at least this much precision are stored as
+# gmpy2.mpz values, which are significantly faster than Python ints for large
+# operands. Below this threshold, native ints win due to lower call overhead.
+GMPY2_PRECISION_THRESHOLD = 512
+
 class InvalidOperationError(Exception):
     def __init__(self, msg):
         self.msg = msg
@@ -31,9 +46,28 @@ class Real:
     # The default precision for new Reals
     default_precision = 256
     
+    # Avoids allocating a per-instance __dict__, which matters for the many
+    # short-lived temporaries produced by arithmetic
+    __slots__ = ('coefficient', 'exponent', 'precision', '_bitlen')
+    
+    def small(value, precision=None):
+        '''
+        Returns a shared Real for the small integer value at the given
+        precision, analogous to CPython's small int cache. The result must be
+        treated as read-only; in particular, never call set_precision on it.
+        '''
+        if precision is None:
+            precision = Real.default_precision
+    
+        key = (value, precision)
+        cached = _small_real_cache.get(key)
+        if cached is None:
+            cached = _small_real_cache[key] = Real(value, precision=precision)
+        return cached
+    
     def __init__(self, arg1, arg2=None, **kwargs):
         if arg2 is None:
-            if isinstance(arg1, int):
+            if isinstance(arg1, (int, mpz)):
                 coefficient, exponent = real_from_int(arg1)
             elif isinstance(arg1, float):
                 coefficient, exponent = real_from_float(arg1)
@@ -48,6 +82,9 @@ class Real:
         if not isinstance(precision, int) or precision <= 0:
             raise ValueError('Real precision must be a positive integer')
         
+        if HAS_GMPY2 and precision > GMPY2_PRECISION_THRESHOLD:
+            coefficient = mpz(coefficient)
+        
         self.coefficient = coefficient
         self.exponent = exponent
         self.precision = precision
@@ -75,34 +112,67 @@ class Real:
         'Normalizes' this real by right shifting the coefficient until it is no
         larger (in bits) than the specified precision. Adds the amount of the
         shift to the exponent so that the approximate value does not change.
-        This operation will sometimes drop bits (changing the exact value)
+        This operation will sometimes drop bits (changing the exact value).
+        Also strips trailing zero bits from the coefficient (which never
+        changes the value) so they don't inflate later operations, and caches
+        the coefficient's bit length in _bitlen for other operations to read.
         '''
-        bit_diff = self.coefficient.bit_length() - self.precision
+        bits = self.coefficient.bit_length()
+        bit_diff = bits - self.precision
         if bit_diff > 0:
             self.coefficient >>= bit_diff
             self.exponent += bit_diff
+            # The arithmetic shift rounds negatives toward -inf, which can
+            # carry the magnitude up to exactly 2 ^ precision, so re-read
+            # the bit length rather than assuming the shift landed on
+            # precision bits
+            bits = self.coefficient.bit_length()
+    
+        if self.coefficient:
+            trailing = trailing_zeros(self.coefficient)
+            self.coefficient >>= trailing
+            self.exponent += trailing
+            bits -= trailing
+        else:
+            # Canonicalize zeros: the exponent carries no information when
+            # the coefficient is zero, and arithmetic can produce zeros with
+            # arbitrary exponents (e.g. 0 * 2 ^ 1), which would otherwise
+            # hash differently from Real(0) despite comparing equal
+            self.exponent = 0
+    
+        self._bitlen = bits
     
     def next(self):
         '''
         Returns the 'next' real: the smallest of all real numbers larger than
         this one with the same precision.
         '''
-        amount = self.precision - self.coefficient.bit_length()
+        # The coefficient is padded back up to full width so the added 1 is
+        # a single ulp; the exponent drops by the same amount to keep the
+        # value in place
+        amount = self.precision - self._bitlen
         coef = (self.coefficient << amount) + 1
-        return Real(coef, self.exponent, precision=self.precision)
+        # Mirror of prev's power-of-two case: stepping up from -2^k crosses
+        # into the binade below, where the ulp is half as large
+        if self.coefficient != -1:
+            return Real(coef, self.exponent - amount, precision=self.precision)
+        else:
+            return Real((coef << 1) - 1, self.exponent - amount - 1, precision=self.precision)
     
     def prev(self):
         '''
         Returns the 'previous' real: the largest of all real numbers smaller
         than this one with the same precision.
         '''
-        bits = self.coefficient.bit_length()
-        amount = self.precision - bits
+        amount = self.precision - self._bitlen
         coef = (self.coefficient << amount) - 1
-        if self.coefficient & bitmask(bits) != 0:
-            return Real(coef, self.exponent, precision=self.precision)
+        # Normalized coefficients are odd, so this one is a power of two
+        # exactly when it is 1; only there does stepping down cross into the
+        # binade below, where the ulp is half as large
+        if self.coefficient != 1:
+            return Real(coef, self.exponent - amount, precision=self.precision)
         else:
-            return Real((coef <<) + 1, self.exponent, precision=self.precision)
+            return Real((coef << 1) + 1, self.exponent - amount - 1, precision=self.precision)
     
     def is_int(self):
         '''
@@ -110,6 +180,14 @@ class Real:
         '''
         # TODO
     
+    def __hash__(self):
+        # Normalized coefficients are odd (or zero), so Reals that compare
+        # equal always share the same (coefficient, exponent) pair, whatever
+        # their precisions; hashing on those two keeps __hash__ consistent
+        # with __eq__. The hash is only stable while the Real is left
+        # unmutated (i.e. set_precision is never called on it).
+        return hash((self.coefficient, self.exponent))
+    
     
     
     # Comparison Operators
@@ -176,38 +254,52 @@ class Real:
     
     # Arithmetic Operators
     
+    # The exact type checks below are deliberate: `type(other) is Real` is
+    # cheaper than an isinstance call, and int operands get dedicated kernels
+    # that skip the wrapper Real entirely. Anything else still goes through
+    # the Real constructor.
+    
     def __add__(self, other):
-        if isinstance(other, Real):
+        cls = type(other)
+        if cls is Real:
             return add(self, other)
+        elif cls is int:
+            return add_int(self, other)
         else:
             return add(self, Real(other))
     
     def __sub__(self, other):
-        if isinstance(other, Real):
+        cls = type(other)
+        if cls is Real:
             return sub(self, other)
+        elif cls is int:
+            return add_int(self, -other)
         else:
             return sub(self, Real(other))
     
     def __mul__(self, other):
-        if isinstance(other, Real):
+        cls = type(other)
+        if cls is Real:
             return mul(self, other)
+        elif cls is int:
+            return mul_int(self, other)
         else:
             return mul(self, Real(other))
     
     def __truediv__(self, other):
-        if isinstance(other, Real):
+        if type(other) is Real:
             return div(self, other)
         else:
             return div(self, Real(other))
     
     def __floordiv__(self, other):
-        if isinstance(other, Real):
-            return floor(div(self, other))
+        if type(other) is Real:
+            return floordiv(self, other)
         else:
-            return floor(div(self, Real(other)))
+            return floordiv(self, Real(other))
     
     def __pow__(self, other):
-        if isinstance(other, Real):
+        if type(other) is Real:
             return _pow(self, other)
         else:
             return _pow(self, Real(other))
@@ -218,18 +310,83 @@ class Real:
 # Auxiliary Functions #
 #######################
 
+# Shared instances handed out by Real.small, keyed by (value, precision)
+_small_real_cache = {}
+
+def _real_raw(coefficient, exponent, precision, bitlen):
+    '''
+    Builds a Real directly, skipping __init__ and normalize. The caller must
+    guarantee the arguments already satisfy the normalization invariants:
+    the coefficient is odd (or zero), holds no more than precision bits, and
+    bitlen is its exact bit length. Used where an operation provably
+    preserves those invariants, so the result doesn't re-pay a bit_length
+    and two conditional shifts just to rediscover them.
+    '''
+    x = Real.__new__(Real)
+    x.coefficient = coefficient
+    x.exponent = exponent
+    x.precision = precision
+    x._bitlen = bitlen
+    return x
+
+@functools.lru_cache(maxsize=4096)
+def _real_const(coefficient, exponent, precision):
+    '''
+    Returns a shared Real for the given parts, so series loops that rebuild
+    the same integer constants on every call pay for construction and
+    normalization only once. Like Real.small results, the returned Reals are
+    shared and must be treated as read-only.
+    '''
+    return Real(coefficient, exponent, precision=precision)
+
 def bitmask(k):
     return (1 << k) - 1
 
+def trailing_zeros(c):
+    '''
+    Counts the trailing zero bits of a nonzero integer. (c & -c) isolates the
+    lowest set bit of c, so the count comes from a single mask and bit_length
+    rather than a Python-level loop; mpz values dispatch straight to GMP's C
+    scan, which avoids even the temporary mask.
+    '''
+    # isinstance rather than an exact type check: int subclasses like bool
+    # are legal coefficients and must not fall through to bit_scan1, which
+    # is None when gmpy2 is absent
+    if not isinstance(c, int):
+        return bit_scan1(c)
+    return (c & -c).bit_length() - 1
+
 def unshift(k):
-    half = k.bit_length()
-    shift = 0
-    while k % 2 == 0:
-        half = (half + 1) // 2
-        if k & bitmask(half) == 0:
-            k >>= half
-            shift += half
-    return k, shift
+    shift = trailing_zeros(k)
+    return k >> shift, shift
+
+@functools.lru_cache(maxsize=2048)
+def pow10(k):
+    '''
+    Returns 10 ^ k for nonnegative k, caching results since string conversion
+    tends to request the same powers over and over.
+    '''
+    return 10 ** k
+
+# Below this coefficient width CPython's own str() is faster than the
+# recursion overhead
+_INT_STR_THRESHOLD = 2400
+
+def _int_to_str(n):
+    '''
+    Converts a nonnegative int to its decimal string. str() on a large int is
+    quadratic in CPython (and refuses outright past sys.int_max_str_digits),
+    so wide values split on a power of ten near the midpoint and recurse on
+    two halves of roughly equal size, for O(M(n) log n) overall. mpz values
+    pass straight to str(), which already runs GMP's subquadratic conversion.
+    '''
+    if type(n) is not int or n.bit_length() < _INT_STR_THRESHOLD:
+        return str(n)
+    
+    digits = int(n.bit_length() * LOG_10_2) + 1
+    half = digits >> 1
+    high, low = divmod(n, pow10(half))
+    return _int_to_str(high) + _int_to_str(low).rjust(half, '0')
 
 
 
@@ -237,6 +394,35 @@ def unshift(k):
 # Conversion Functions #
 ########################
 
+def _pow5(m, precision):
+    '''
+    Returns 5 ^ m as a Real at the given precision via binary exponentiation;
+    m may be negative.
+    '''
+    result = _real_const(1, 0, precision)
+    base = _real_const(5, 0, precision)
+    k = abs(m)
+    while k:
+        if k & 1:
+            result = mul(result, base)
+        base = mul(base, base)
+        k >>= 1
+    
+    if m < 0:
+        result = div(Real(1, 0, precision=precision), result)
+    return result
+
+_log10_2_cache = {}
+
+def log10_2(precision):
+    '''
+    Returns log10(2) = ln(2) / ln(10) as a Real, cached per precision.
+    '''
+    cached = _log10_2_cache.get(precision)
+    if cached is None:
+        cached = _log10_2_cache[precision] = div(Ln2.get(precision), Ln10.get(precision))
+    return cached
+
 def real_from_int(i):
     '''
     Returns the (coefficient, exponent) tuple which represents the int i.
@@ -247,11 +433,15 @@ def real_from_float(f):
     '''
     Returns the (coefficient, exponent) tuple which represents the float f.
     '''
-    coefficient, exponent = math.frexp(f)
-    while math.floor(coefficient) != coefficient:
-        coefficient *= 2
-        exponent -= 1
-    return int(coefficient), int(exponent)
+    if not math.isfinite(f):
+        raise ValueError('Cannot construct a Real from {!r}'.format(f))
+    if f == 0.0:
+        return 0, 0
+    
+    # For finite floats the denominator is always a power of two, so the
+    # exact binary expansion falls out of a single as_integer_ratio call
+    numerator, denominator = f.as_integer_ratio()
+    return numerator, -(denominator.bit_length() - 1)
 
 def real_from_str(s):
     '''
@@ -267,17 +457,53 @@ def str_from_real(x):
     if x.coefficient == 0:
         return '0'
     
-    # TODO minimize floating point errors in string representation
-    
-    # Calculate base 10 exponent and coefficient
     c, a = unshift(x.coefficient)
-    v = (x.exponent + a) * LOG_10_2 # FIXME float errors likely occur here
-    exponent = int(v)
-    coefficient = int(c * 10 ** (v - exponent))
+    e = x.exponent + a
+    cbits = c.bit_length()
+    
+    # Number of significant decimal digits the coefficient can support, and
+    # an estimate of the base 10 magnitude of the value. Estimation error here
+    # only changes the digit count by one, not the value of the output, so the
+    # float constant serves until its roundoff could reach the units place;
+    # past that the estimate is computed from the Real-valued log10(2)
+    digits = int(cbits * LOG_10_2) + 1
+    t = e + cbits
+    if -(1 << 40) < t < (1 << 40):
+        magnitude = math.floor(t * LOG_10_2)
+    else:
+        lg2 = log10_2(t.bit_length() + 16)
+        magnitude = (t * lg2.coefficient) >> -lg2.exponent
+    
+    # Scale the value by 10 ^ m so that about `digits` digits remain, using
+    # exact integer arithmetic (truncating toward zero). Past a million bits
+    # of exponent the exact intermediates get too large to materialize, so
+    # the scaling runs in Real arithmetic at a bounded working precision
+    # instead; only the last digit can wobble from its roundoff
+    m = digits - magnitude
+    if -(1 << 20) < e < (1 << 20):
+        n = abs(c)
+        if e >= 0:
+            n <<= e
+        if m >= 0:
+            n *= pow10(m)
+        else:
+            n //= pow10(-m)
+        if e < 0:
+            n >>= -e
+    else:
+        # repeated squaring amplifies relative error by a factor of m, so
+        # budget one extra working bit per bit of m
+        work = cbits + abs(m).bit_length() + 16
+        scaled = mul(Real(abs(c), e + m, precision=work), _pow5(m, work))
+        if scaled.exponent >= 0:
+            n = scaled.coefficient << scaled.exponent
+        else:
+            n = scaled.coefficient >> -scaled.exponent
     
-    # Build strings for each piece
-    sign = '-' if coefficient < 0 else ''
-    digits = str(abs(coefficient))
+    # Build strings for each piece; the scaled value reads n * 10 ^ -m
+    exponent = -m
+    sign = '-' if x.coefficient < 0 else ''
+    digits = _int_to_str(n)
     head, tail = digits[0], digits[1:]
     
     # Correct exponent to match the decimal shift of coefficient
@@ -298,23 +524,67 @@ def str_from_real(x):
 # Arithmetic #
 ##############
 
+def _prep(x, y):
+    '''
+    Loads the operands and result precision for a binary operation in one
+    place, so each kernel pays for a single tuple unpack instead of repeating
+    the attribute lookups and the min() call.
+    '''
+    xp = x.precision
+    yp = y.precision
+    return x.coefficient, x.exponent, y.coefficient, y.exponent, xp if xp < yp else yp
+
+def _add_core(xc, xe, yc, ye, prec=None):
+    '''
+    Computes the sum of (xc * 2 ^ xe) and (yc * 2 ^ ye), returning the result
+    as an unnormalized (coefficient, exponent) pair. The sum is exact unless
+    prec is given, in which case an operand lying entirely below the other's
+    round-off is dropped rather than aligned, avoiding an arbitrarily large
+    shift whose bits normalize would discard anyway.
+    '''
+    # Rename operands based on the size of their exponents
+    if xe > ye:
+        xc, xe, yc, ye = yc, ye, xc, xe
+    
+    if prec is not None:
+        if not yc:
+            return xc, xe
+        if not xc:
+            return yc, ye
+        mx = xe + xc.bit_length()
+        my = ye + yc.bit_length()
+        if mx - my > prec + 8:
+            return xc, xe
+        if my - mx > prec + 8:
+            return yc, ye
+    
+    return xc + (yc << (ye - xe)), xe
+
 def compare(x, y):
     '''
     Compares two reals x and y and returns 1 if x is greater than y, 0 if x is
     equal to y, and -1 if x is less than y.
     '''
+    sx = 1 if x.coefficient > 0 else -1 if x.coefficient < 0 else 0
+    sy = 1 if y.coefficient > 0 else -1 if y.coefficient < 0 else 0
     
-    # Negate y
-    y.coefficient = -y.coefficient
+    # Differing (or zero) signs decide the comparison outright
+    if sx != sy:
+        return 1 if sx > sy else -1
+    if sx == 0:
+        return 0
     
-    # Rename reals based on the size of their exponents
-    if x.exponent > y.exponent:
-        x, y = y, x
+    # The magnitude of (c * 2 ^ e) lies in [2 ^ (m - 1), 2 ^ m) for the m
+    # below, so differing m decide the comparison without any bignum work
+    mx = x.exponent + x._bitlen
+    my = y.exponent + y._bitlen
+    if mx != my:
+        return sx if mx > my else -sx
     
-    # Calculate the new coefficient
-    c = x.coefficient + (y.coefficient << (y.exponent - x.exponent))
+    # Magnitudes agree to within a factor of 2; fall back to an exact
+    # subtraction
+    c, _ = _add_core(x.coefficient, x.exponent, -y.coefficient, y.exponent)
     
-    #
     if c > 0:
         return 1
     elif c < 0:
@@ -323,11 +593,12 @@ def compare(x, y):
         return 0
 
 def neg(x):
-    return Real(-x.coefficient, x.exponent, precision=x.precision)
+    # Negation preserves magnitude, so the normalized form carries over
+    return _real_raw(-x.coefficient, x.exponent, x.precision, x._bitlen)
 
 # Called _abs to differentate with builtin abs
 def _abs(x):
-    return Real(abs(x.coefficient), x.exponent, precision=x.precision)
+    return _real_raw(abs(x.coefficient), x.exponent, x.precision, x._bitlen)
 
 def round_zero(x):
     '''
@@ -344,17 +615,25 @@ def round_inf(x):
 # Called _round to differentate with builtin round
 def _round(x):
     if x.exponent >= 0:
+        # Already an integer; normalize would just strip the shifted-in
+        # zeros again, so reuse the parts directly when they fit the default
+        # precision
+        if x._bitlen + x.exponent <= Real.default_precision:
+            return _real_raw(x.coefficient, x.exponent, Real.default_precision, x._bitlen)
         return Real(x.coefficient << x.exponent)
     
+    # (c + 1) >> 1 rounds halves upward in one add and one shift:
+    # for even c the added bit is shifted back out, for odd c it carries.
+    # This matches the old 'if c % 2 == 1: c += 1' for negatives too, since
+    # Python defines -c % 2 == 1 for odd negative c
     exp = -x.exponent
-    x = x.coefficient >> (exp - 1)
-    if x % 2 == 1:
-        x += 1
-    
-    return Real(x >> 1)
+    return Real(((x.coefficient >> (exp - 1)) + 1) >> 1)
 
 def floor(x):
     if x.exponent >= 0:
+        # Already an integer; see _round for the fast path rationale
+        if x._bitlen + x.exponent <= Real.default_precision:
+            return _real_raw(x.coefficient, x.exponent, Real.default_precision, x._bitlen)
         return Real(x.coefficient << x.exponent)
     
     if x.coefficient < 0:
@@ -365,113 +644,258 @@ def floor(x):
 
 def ceil(x):
     if x.exponent >= 0:
+        # Already an integer; see _round for the fast path rationale
+        if x._bitlen + x.exponent <= Real.default_precision:
+            return _real_raw(x.coefficient, x.exponent, Real.default_precision, x._bitlen)
         return Real(x.coefficient << x.exponent)
     
     if x.coefficient < 0:
         return -floor(-x)
     
     exp = -x.exponent
-    if (x.coefficient & bitmask(exp)) != 0:
+    # bitmask(exp), inlined to skip the helper call on this hot path
+    if (x.coefficient & ((1 << exp) - 1)) != 0:
         return Real((x.coefficient >> exp) + 1)
     else:
         return Real(x.coefficient >> exp)
 
 def add(x, y):
-    # Rename reals based on the size of their exponents
-    if x.exponent > y.exponent:
-        x, y = y, x
-    
-    # Calculate the new coefficient, exponent, and precision
-    coefficient = x.coefficient + (y.coefficient << (y.exponent - x.exponent))
-    exponent = x.exponent
-    precision = min(x.precision, y.precision)
-    
+    xc, xe, yc, ye, precision = _prep(x, y)
+    coefficient, exponent = _add_core(xc, xe, yc, ye, precision)
     return Real(coefficient, exponent, precision=precision)
 
 def sub(x, y):
-    # Negate y
-    y.coefficient = -y.coefficient
-    
-    res = add(x, y)
-    
-    # Reset sign of y
-    y.coefficient = -y.coefficient
-    
-    return res
+    # Negating the coefficient here (rather than mutating y) keeps sub safe
+    # when x is y and when y is shared between threads
+    xc, xe, yc, ye, precision = _prep(x, y)
+    coefficient, exponent = _add_core(xc, xe, -yc, ye, precision)
+    return Real(coefficient, exponent, precision=precision)
+
+def add_int(x, i):
+    '''
+    Adds a native int to a Real without wrapping the int in a Real first; the
+    int participates in _add_core as an exact operand with exponent 0.
+    '''
+    precision = x.precision
+    coefficient, exponent = _add_core(x.coefficient, x.exponent, i, 0, precision)
+    return Real(coefficient, exponent, precision=precision)
+
+def mul_int(x, i):
+    '''
+    Multiplies a Real by a native int without wrapping the int in a Real
+    first. The product needs no exponent work since the int contributes an
+    exponent of 0.
+    '''
+    return Real(x.coefficient * i, x.exponent, precision=x.precision)
 
 def mul(x, y):
-    # Calculate the new coefficient, exponent, and precision
-    coefficient = x.coefficient * y.coefficient
-    exponent = x.exponent + y.exponent
-    precision = min(x.precision, y.precision)
+    xc, xe, yc, ye, precision = _prep(x, y)
     
-    return Real(coefficient, exponent, precision=precision)
+    # Coefficients above GMPY2_PRECISION_THRESHOLD already live in mpz (see
+    # Real.__init__), so wide multiplications normally reach GMP's Toom/FFT
+    # kernels on their own. Native-int operands can still produce a wide
+    # product when both sit near the threshold; promote one so the multiply
+    # itself runs in GMP
+    if (HAS_GMPY2 and type(xc) is int and type(yc) is int
+            and x._bitlen + y._bitlen >= 2 * GMPY2_PRECISION_THRESHOLD):
+        xc = mpz(xc)
+    
+    return Real(xc * yc, xe + ye, precision=precision)
 
 def div(x, y):
     if y.coefficient == 0:
         raise InvalidOperationError('Cannot divide a Real by 0')
     
-    k = 2 * max(x.precision, y.precision) + 1
+    xc, xe, yc, ye, precision = _prep(x, y)
     
-    # Calculate the new coefficient, exponent, and precision
-    coefficient = (x.coefficient << k) // y.coefficient
-    exponent = x.exponent - y.exponent - k
-    precision = min(x.precision, y.precision)
+    # Shift x just far enough that the quotient comes out with the target
+    # precision plus a few guard bits, instead of doubling the dividend's
+    # width and letting normalize discard the excess
+    k = precision + 4 + y._bitlen - x._bitlen
+    if k < 0:
+        k = 0
     
-    return Real(coefficient, exponent, precision=precision)
+    return Real((xc << k) // yc, xe - ye - k, precision=precision)
+
+def floordiv(x, y):
+    '''
+    Computes floor(x / y) with a single integer division, skipping the
+    intermediate full-precision quotient that floor(div(x, y)) would build
+    and then throw away.
+    '''
+    if y.coefficient == 0:
+        raise InvalidOperationError('Cannot divide a Real by 0')
+    
+    # Align the exponents so the integer quotient lands on the unit digit;
+    # Python's floor division handles both sign cases directly
+    e = x.exponent - y.exponent
+    if e >= 0:
+        coefficient = (x.coefficient << e) // y.coefficient
+    else:
+        coefficient = x.coefficient // (y.coefficient << -e)
+    
+    return Real(coefficient, 0)
 
 # Called _pow to differentate with builtin pow
 def _pow(x, y):
-    # TODO
+    # TODO negative bases with integer exponents
     if y.coefficient == 0:
-        return Real(1)
-        
+        return Real.small(1, min(x.precision, y.precision))
+    
     elif x.coefficient == 0:
         return x
-        
-    elif y.isint():
-        pass
-        
-    elif x > 0:
-        return exp(y * log(x))
-        
+    
+    elif x.coefficient > 0:
+        return exp(mul(y, log(x)))
+    
     else:
         raise InvalidOperationError('Cannot evalute an exponential with a negative base')
 
 def exp(x):
-    raise NotImplementedError()
+    '''
+    Computes e ^ x. The argument is reduced to x = q * ln(2) + r with
+    0 <= r < ln(2), so the series runs on the small remainder and the
+    quotient becomes a plain exponent adjustment.
+    '''
+    prec = x.precision
+    work = prec + 32
+    
+    if x.coefficient == 0:
+        return Real.small(1, prec)
+    
+    # The reduction has to cancel x's whole magnitude down to a remainder
+    # below ln(2), so ln(2) and the subtraction carry the magnitude on top
+    # of the working precision; only the series runs at the narrower width.
+    # Past a million bits of magnitude that ln(2) is no longer practical to
+    # compute, so refuse rather than appear to hang
+    mag = x.exponent + x._bitlen
+    if mag > (1 << 20):
+        raise InvalidOperationError('Cannot evaluate exp for arguments this large')
+    red = work + mag if mag > 0 else work
+    ln2 = Ln2.get(red)
+    
+    # floordiv truncates its result to the default precision, which for wide
+    # arguments would leave a remainder far outside [0, ln(2)); align the
+    # exponents and take the exact integer quotient instead
+    e = x.exponent - ln2.exponent
+    if e >= 0:
+        q_int = (x.coefficient << e) // ln2.coefficient
+    else:
+        q_int = x.coefficient // (ln2.coefficient << -e)
+    q_int = int(q_int)
+    
+    r = sub(Real(x.coefficient, x.exponent, precision=red), mul(Real(q_int, precision=red), ln2))
+    r = Real(r.coefficient, r.exponent, precision=work)
+    
+    # Find the term count: r ^ N / N! must drop below the working precision
+    mag = r.exponent + r._bitlen if r.coefficient else -work
+    n = 1
+    while n * mag - math.lgamma(n + 1) / math.log(2) > -work:
+        n += 1
+    
+    # Evaluate N! * (sum r^k / k!) by Horner with integer coefficients
+    # N!/k!, then divide by N! once at the end
+    a = 1
+    acc = _real_const(1, 0, work)
+    for k in range(n - 1, -1, -1):
+        a *= k + 1
+        acc = add(mul(acc, r), _real_const(a, 0, work))
+    
+    res = div(acc, _real_const(a, 0, work))
+    return Real(res.coefficient, res.exponent + q_int, precision=prec)
 
 def log(x):
-    # ln(x)
-    #       = ln(c * 2^x)
-    #       = ln(c / 2^p * 2^p * 2^x)
-    #       = ln(c / 2^p) + ln(2^(p + x))
-    #       = ln(c / 2^p) + (p + x) * ln(2)
+    '''
+    Computes ln(x) for positive x. The argument is split as m * 2 ^ s with
+    m in [1, 2), so ln(x) = ln(m) + s * ln(2), and ln(m) comes from the
+    series 2 * atanh(z) with z = (m - 1) / (m + 1) in [0, 1/3).
+    '''
+    if x.coefficient <= 0:
+        raise InvalidOperationError('Cannot evaluate the logarithm of a non-positive Real')
     
-    # ln(1 + x)
-    #       = x + x^2/2 + x^3/3 + x^4/4 + x^5/5 ...
+    prec = x.precision
+    work = prec + 32
     
-    # ln(2) = 1/(1 * 2) + 1/(2 * 4) + 1/(3 * 8) + .... + 1/(k * 2^k) + ...
-    # ln(10) =
+    m = Real(x.coefficient, -(x._bitlen - 1), precision=work)
+    s = x.exponent + x._bitlen - 1
     
-    raise NotImplementedError()
+    one = Real.small(1, work)
+    z = div(sub(m, one), add(m, one))
+    
+    if z.coefficient == 0:
+        ln_m = Real(0, 0, precision=work)
+    else:
+        # Find the term count: z ^ (2N + 1) drops below the working precision
+        mag = z.exponent + z._bitlen
+        n = 0
+        while (2 * n + 1) * mag > -work:
+            n += 1
+    
+        # Evaluate D * (sum z^(2k+1) / (2k+1)) by Horner in z^2 with integer
+        # coefficients D / (2k+1), where D is the product of the odd numbers
+        # up to 2N+1; a single division by D lands at the end
+        d = 1
+        for k in range(n + 1):
+            d *= 2 * k + 1
+    
+        zsqr = mul(z, z)
+        acc = _real_const(d // (2 * n + 1), 0, work)
+        for k in range(n - 1, -1, -1):
+            acc = add(mul(acc, zsqr), _real_const(d // (2 * k + 1), 0, work))
+    
+        ln_m = div(mul(z, acc), _real_const(d, 0, work))
+        ln_m = Real(ln_m.coefficient, ln_m.exponent + 1, precision=work)
+    
+    res = add(ln_m, mul(Real(s, precision=work), Ln2.get(work)))
+    return Real(res.coefficient, res.exponent, precision=prec)
 
 def sqrt(x):
     # babylonian method
     raise NotImplementedError()
 
 def sin(x):
-    raise NotImplementedError()
-    xsqr = x * x
-    num = x
-    den = Real(1, precision=x.precision)
-    i = 0
-    while True: # TODO
-        i += 2
-        num *= xsqr
-        den *= Real(i * (i + 1))
-        x += num / den
-    return x
+    '''
+    Computes sin(x) from the Taylor series. Terms are folded into a Horner
+    evaluation in x ^ 2 with the integer coefficients (2N+1)! / (2k+1)!, so
+    the whole series costs N multiplies and a single division instead of a
+    division per term. No range reduction is performed yet (that needs Pi),
+    so the term count — and with it the working precision below — grows
+    with |x|, making large arguments increasingly expensive.
+    '''
+    prec = x.precision
+    work = prec + 32
+    
+    if x.coefficient == 0:
+        return Real(0, 0, precision=prec)
+    
+    # Find the term count: x ^ (2N+1) / (2N+1)! must drop below the working
+    # precision
+    mag = x.exponent + x._bitlen
+    n = 0
+    while (2 * n + 1) * mag - math.lgamma(2 * n + 2) / math.log(2) > -work:
+        n += 1
+    
+    # For |x| > 1 the alternating terms climb to ~e^|x| before cancelling
+    # back down to |sin| <= 1, so that many low bits of the accumulator are
+    # noise by the end; widen the working precision to cover the peak and
+    # re-extend the term count to the new target
+    if mag > 0:
+        work += n * mag
+        while (2 * n + 1) * mag - math.lgamma(2 * n + 2) / math.log(2) > -work:
+            n += 1
+    
+    xw = Real(x.coefficient, x.exponent, precision=work)
+    xsqr = mul(xw, xw)
+    
+    a = 1 - 2 * (n & 1)    # (-1) ^ N
+    acc = _real_const(a, 0, work)
+    for k in range(n - 1, -1, -1):
+        a *= -((2 * k + 2) * (2 * k + 3))
+        acc = add(mul(acc, xsqr), _real_const(a, 0, work))
+    
+    # After the loop a holds (2N+1)!, the shared denominator
+    res = div(mul(xw, acc), _real_const(a, 0, work))
+    return Real(res.coefficient, res.exponent, precision=prec)
 
 def cos(x):
     raise NotImplementedError()
@@ -492,12 +916,48 @@ def root(x, n):
 ###
 
 class Ln2:
+    _cache = {}
+    
     def get(precision):
-        pass
+        '''
+        Returns ln(2) as a Real with the given precision, computed with
+        integer arithmetic from the series ln(2) = sum(1 / (k * 2 ^ k)).
+        Results are cached per precision.
+        '''
+        cached = Ln2._cache.get(precision)
+        if cached is None:
+            # Work with guard bits so the per-term truncation stays below
+            # the requested precision
+            work = precision + 16
+            total = 0
+            for k in range(1, work + 1):
+                total += (1 << (work - k)) // k
+            cached = Ln2._cache[precision] = Real(total, -work, precision=precision)
+        return cached
 
 class Ln10:
+    _cache = {}
+    
     def get(precision):
-        pass
+        '''
+        Returns ln(10) as a Real with the given precision, computed as
+        3 * ln(2) + ln(5 / 4) where ln(5 / 4) comes from the alternating
+        series sum((-1) ^ (k + 1) / (k * 4 ^ k)). Results are cached per
+        precision.
+        '''
+        cached = Ln10._cache.get(precision)
+        if cached is None:
+            work = precision + 16
+            total = 0
+            sign = 1
+            for k in range(1, work // 2 + 1):
+                total += sign * ((1 << (work - 2 * k)) // k)
+                sign = -sign
+    
+            ln2 = Ln2.get(precision)
+            three_ln2 = Real(3 * ln2.coefficient, ln2.exponent, precision=precision)
+            cached = Ln10._cache[precision] = add(three_ln2, Real(total, -work, precision=precision))
+        return cached
 
 class E:
     def get(precision):